@@ -19,6 +19,16 @@ import os
 from difflib import SequenceMatcher
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
 # Initialize file names
 BIB_FILE = 'bibliography_db.json'
 SETTINGS_FILE = 'settings.json'
@@ -29,6 +39,14 @@ BIBTEX_FIELDS_FILE = 'bibtexFields.json'
 bibtex_info = {}
 BIB_ENTRY_TYPES = []
 BIB_FIELDS = []
+_type_req_opt = {}
+_type_required_flat = {}
+
+# Parsed database, reused until the file changes on disk
+_db_cache = {'mtime': None, 'data': None, 'lower': {}, 'normalized': None}
+
+# Parsed BibTeX field definitions, reused until bibtexFields.json or the settings change
+_bibtex_fields_cache = {'mtime': None}
 
 def init_files():
     """
@@ -43,34 +61,115 @@ def init_files():
                        'match_options': ['contains'],
                        'fuzzy_sensitivity': 80}, f)
 
+def primary_field(spec):
+    """
+    Get the field a required/optional specifier refers to, e.g. 'author' for 'author or editor'.
+    Args:
+        spec (str): Field specifier from bibtexFields.json.
+    Returns:
+        str: The first field named in the specifier.
+    """
+    return spec.replace(' and/or ', ' or ').split(' or ')[0].strip()
+
 def load_bibtex_fields():
     """
     Load BibTeX entry types and fields from the bibtexFields.json file.
     Updates global variables for entry types and fields.
+    The files are only parsed again when bibtexFields.json or the settings file has changed.
     """
-    global bibtex_info, BIB_ENTRY_TYPES, BIB_FIELDS
-    with open(BIBTEX_FIELDS_FILE, 'r') as f:
-        bibtex_info = json.load(f)
-        BIB_ENTRY_TYPES = list(bibtex_info['entry_types'].keys())
-        BIB_FIELDS = list(bibtex_info['fields'].keys())
-        settings = load_settings()
-        field_order = settings.get('field_order', [])
+    global bibtex_info, BIB_ENTRY_TYPES, BIB_FIELDS, _type_req_opt, _type_required_flat
+    stamp = (file_stamp(BIBTEX_FIELDS_FILE), file_stamp(SETTINGS_FILE))
+    if _bibtex_fields_cache['mtime'] != stamp:
+        info = read_json(BIBTEX_FIELDS_FILE)
+        fields = list(info['fields'].keys())
+        field_order = load_settings().get('field_order', [])
         if field_order:
-            BIB_FIELDS = [f for f in field_order if f in BIB_FIELDS]
-            BIB_FIELDS += [f for f in BIB_FIELDS if f not in field_order]
-            seen = set()
-            BIB_FIELDS = [x for x in BIB_FIELDS if not (x in seen or seen.add(x))]
+            known = set(fields)
+            ordered = [f for f in field_order if f in known]
+            fields = list(dict.fromkeys(ordered + fields))
+        required_flat = {t: [primary_field(f) for f in spec['required']] for t, spec in info['entry_types'].items()}
+        _bibtex_fields_cache.update(
+            mtime=stamp,
+            info=info,
+            entry_types=list(info['entry_types'].keys()),
+            fields=fields,
+            required_flat=required_flat,
+            type_req_opt={
+                t: (frozenset(required_flat[t]),
+                    frozenset(primary_field(f) for f in spec['optional']))
+                for t, spec in info['entry_types'].items()
+            }
+        )
+    bibtex_info = _bibtex_fields_cache['info']
+    BIB_ENTRY_TYPES = _bibtex_fields_cache['entry_types']
+    BIB_FIELDS = _bibtex_fields_cache['fields']
+    _type_req_opt = _bibtex_fields_cache['type_req_opt']
+    _type_required_flat = _bibtex_fields_cache['required_flat']
 
 match_options_all = ['exact', 'contains', 'case-sensitive', 'regex', 'fuzzy']
 
+# Fields shown in the browse table's Source column, in order of preference
+_SOURCE_KEYS = ("journal", "booktitle", "conference", "publisher", "organization")
+
+def read_json(path):
+    """
+    Read and parse a JSON file, using orjson when it is available.
+    Args:
+        path (str): Path of the JSON file.
+    Returns:
+        The parsed JSON data.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def write_json(path, data):
+    """
+    Serialize data to a JSON file with 2-space indentation, using orjson when it is available.
+    Args:
+        path (str): Path of the JSON file.
+        data: The data to write.
+    """
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def file_stamp(path):
+    """
+    Return a stamp identifying the current version of a file on disk.
+    Args:
+        path (str): Path of the file.
+    Returns:
+        tuple: The file's modification time (ns) and size.
+    """
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def refresh_db_cache():
+    """
+    Re-parse the database file into the cache if it has changed since the last load or save.
+    """
+    stamp = file_stamp(BIB_FILE)
+    if _db_cache['mtime'] != stamp:
+        _db_cache['data'] = read_json(BIB_FILE)
+        _db_cache['mtime'] = stamp
+        _db_cache['lower'] = {}
+        _db_cache['normalized'] = None
+
 def load_db():
     """
     Load the bibliography database from the JSON file.
+    The file is only parsed again when it has changed since the last load or save.
     Returns:
-        dict: The loaded database.
+        dict: The loaded database (a shallow copy that the caller may modify).
     """
-    with open(BIB_FILE, 'r') as f:
-        return json.load(f)
+    refresh_db_cache()
+    return dict(_db_cache['data'])
 
 def save_db(data):
     """
@@ -78,8 +177,48 @@ def save_db(data):
     Args:
         data (dict): The database to save.
     """
-    with open(BIB_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(BIB_FILE, data)
+    _db_cache['data'] = dict(data)
+    _db_cache['mtime'] = file_stamp(BIB_FILE)
+    _db_cache['lower'] = {}
+    _db_cache['normalized'] = None
+
+def load_lowercase_field(field):
+    """
+    Get the casefolded (lowercased) values of a field for every entry in the database.
+    The values are computed once per field and reused until the database is reloaded or saved.
+    Args:
+        field (str): The field name.
+    Returns:
+        dict: Mapping of entry key to the casefolded field value.
+    """
+    refresh_db_cache()
+    lower = _db_cache['lower']
+    if field not in lower:
+        lower[field] = {key: entry.get(field, '').casefold() for key, entry in _db_cache['data'].items()}
+    return lower[field]
+
+def normalize_title_author(entry):
+    """
+    Normalize an entry's title and author for duplicate detection.
+    Args:
+        entry (dict): The entry fields.
+    Returns:
+        tuple: The stripped, lowercased title and author.
+    """
+    return (entry.get('title', '').strip().lower(), entry.get('author', '').strip().lower())
+
+def load_normalized_title_author():
+    """
+    Get the normalized (title, author) of every entry in the database.
+    Computed once and reused until the database is reloaded or saved.
+    Returns:
+        dict: Mapping of entry key to its normalized (title, author).
+    """
+    refresh_db_cache()
+    if _db_cache['normalized'] is None:
+        _db_cache['normalized'] = {key: normalize_title_author(entry) for key, entry in _db_cache['data'].items()}
+    return _db_cache['normalized']
 
 def load_settings():
     """
@@ -87,8 +226,7 @@ def load_settings():
     Returns:
         dict: The loaded settings.
     """
-    with open(SETTINGS_FILE, 'r') as f:
-        return json.load(f)
+    return read_json(SETTINGS_FILE)
 
 def save_settings(settings):
     """
@@ -96,8 +234,7 @@ def save_settings(settings):
     Args:
         settings (dict): The settings to save.
     """
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=2)
+    write_json(SETTINGS_FILE, settings)
 
 def entry_form_gui(
     mode="add",
@@ -128,7 +265,6 @@ def entry_form_gui(
 
     fields = {}
     field_labels = {}
-    help_labels = {}
 
     row = 0
     if show_key:
@@ -153,26 +289,30 @@ def entry_form_gui(
     entry_type_help.grid(row=row, column=2, sticky='w')
     row += 1
 
+    # (is_required, is_enabled) per field as currently shown, fields start out enabled and not required
+    field_state = {field: (False, True) for field in BIB_FIELDS}
+
     def update_fields(*args):
         """
-        Update the form fields and help texts based on the selected entry type.
+        Update the form fields based on the selected entry type.
+        Only the widgets whose required/enabled state changes are reconfigured.
         """
         entry_type = entry_type_var.get()
         entry_type_help.config(text=bibtex_info['entry_types'][entry_type]['description'])
-        required = set([f.replace(' or ', '/').split('/')[0] for f in bibtex_info['entry_types'][entry_type]['required']])
-        optional = set([f.replace(' or ', '/').split('/')[0] for f in bibtex_info['entry_types'][entry_type]['optional']])
+        required, optional = _type_req_opt[entry_type]
         for field in BIB_FIELDS:
             is_required = field in required
-            is_optional = field in optional
-            label = field_labels[field]
-            help_label = help_labels[field]
-            label.config(text=f"{field.capitalize()}{' *' if is_required else ''}")
-            if is_required or is_optional:
-                fields[field].config(state='normal')
-            else:
-                fields[field].delete(0, tk.END)
-                fields[field].config(state='disabled')
-            help_label.config(text=bibtex_info['fields'].get(field, ""), fg="gray")
+            is_enabled = is_required or field in optional
+            was_required, was_enabled = field_state[field]
+            if is_required != was_required:
+                field_labels[field].config(text=f"{field.capitalize()}{' *' if is_required else ''}")
+            if is_enabled != was_enabled:
+                if is_enabled:
+                    fields[field].config(state='normal')
+                else:
+                    fields[field].delete(0, tk.END)
+                    fields[field].config(state='disabled')
+            field_state[field] = (is_required, is_enabled)
 
     entry_type_var.trace_add('write', update_fields)
 
@@ -187,7 +327,6 @@ def entry_form_gui(
         help_label.grid(row=row+i, column=2, sticky='w')
         fields[field] = ent
         field_labels[field] = label
-        help_labels[field] = help_label
 
     update_fields()
 
@@ -198,22 +337,7 @@ def entry_form_gui(
         db = load_db()
         new_key = key_entry.get().strip() if key_entry else (key if key else "")
         entry_type = entry_type_var.get().strip()
-        required_fields = bibtex_info['entry_types'][entry_type]['required']
-        required_flat = []
-        for rf in required_fields:
-            if ' or ' in rf:
-                required_flat.append(rf.split(' or ')[0])
-            elif ' and/or ' in rf:
-                required_flat.append(rf.split(' and/or ')[0])
-            else:
-                required_flat.append(rf)
-        missing = []
-        for rf in required_flat:
-            rf = rf.strip()
-            if rf == "key":
-                continue
-            if not fields[rf].get().strip():
-                missing.append(rf)
+        missing = [rf for rf in _type_required_flat[entry_type] if rf != "key" and not fields[rf].get().strip()]
         if show_key and not new_key:
             messagebox.showerror("Error", "Please enter a value for 'Key'.")
             return
@@ -271,18 +395,197 @@ def edit_entry_gui(key):
         messagebox.showerror("Error", "Key not found")
         return
     entry = db[key]
+    opened_stamp = file_stamp(BIB_FILE)
     def on_save(new_key, new_entry):
-        db2 = load_db()
-        if new_key != key and new_key in db2:
+        nonlocal db
+        # Only reload if the database file changed while the form was open
+        if file_stamp(BIB_FILE) != opened_stamp:
+            db = load_db()
+        if new_key != key and new_key in db:
             messagebox.showerror("Error", "Key already exists.")
             return
         if new_key != key:
-            del db2[key]
-        db2[new_key] = new_entry
-        save_db(db2)
+            db.pop(key, None)
+        db[new_key] = new_entry
+        save_db(db)
         messagebox.showinfo("Updated", "Entry updated successfully.")
     entry_form_gui(mode="edit", key=key, entry_data=entry, on_save=on_save, title=f"Edit Entry: {key}")
 
+def parse_bibtex(text):
+    """
+    Parse BibTeX entries from a string in a single pass.
+    Field values may span several lines, contain nested braces, be quoted,
+    or be concatenated with '#'. @comment, @preamble and @string blocks are skipped.
+    Args:
+        text (str): The BibTeX source.
+    Returns:
+        list: (key, entry) tuples, where entry maps lowercase field names to
+        values and includes the 'entry_type'.
+    """
+    parsed_entries = []
+    length = len(text)
+
+    def skip_space(i):
+        while i < length and text[i].isspace():
+            i += 1
+        return i
+
+    def read_braced(i):
+        # text[i] is the opening brace; returns the content and the index after the closing brace
+        depth = 0
+        for j in range(i, length):
+            if text[j] == '{':
+                depth += 1
+            elif text[j] == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[i+1:j], j + 1
+        return text[i+1:], length
+
+    def read_quoted(i):
+        # text[i] is the opening quote; quotes inside braces do not end the value
+        depth = 0
+        for j in range(i + 1, length):
+            if text[j] == '{':
+                depth += 1
+            elif text[j] == '}':
+                depth -= 1
+            elif text[j] == '"' and depth <= 0:
+                return text[i+1:j], j + 1
+        return text[i+1:], length
+
+    def read_value(i):
+        parts = []
+        while True:
+            i = skip_space(i)
+            if i >= length:
+                break
+            if text[i] == '{':
+                part, i = read_braced(i)
+            elif text[i] == '"':
+                part, i = read_quoted(i)
+            else:
+                start = i
+                while i < length and text[i] not in ',}#':
+                    i += 1
+                part = text[start:i].strip()
+            parts.append(part)
+            i = skip_space(i)
+            if i < length and text[i] == '#':
+                i += 1
+                continue
+            break
+        return ' '.join(''.join(parts).split()), i
+
+    pos = text.find('@')
+    while pos != -1:
+        i = pos + 1
+        while i < length and (text[i].isalnum() or text[i] in '_-'):
+            i += 1
+        entry_type = text[pos+1:i].lower()
+        i = skip_space(i)
+        if not entry_type or i >= length or text[i] != '{':
+            pos = text.find('@', i)
+            continue
+        if entry_type in ('comment', 'preamble', 'string'):
+            _, i = read_braced(i)
+            pos = text.find('@', i)
+            continue
+
+        i += 1
+        start = i
+        while i < length and text[i] not in ',}':
+            i += 1
+        key = text[start:i].strip()
+        entry = {}
+        while i < length:
+            if text[i] == '}':
+                i += 1
+                break
+            if text[i] == ',' or text[i].isspace():
+                i += 1
+                continue
+            start = i
+            while i < length and text[i] not in '=,}':
+                i += 1
+            if i >= length or text[i] != '=':
+                continue
+            field = text[start:i].strip().lower()
+            value, i = read_value(i + 1)
+            if field:
+                entry[field] = value
+
+        if key:
+            entry['entry_type'] = entry_type
+            parsed_entries.append((key, entry))
+        pos = text.find('@', i)
+
+    return parsed_entries
+
+class DuplicateIndex:
+    """
+    Index of entries by normalized (title, author), used to find duplicate entries in O(1).
+    Kept up to date with add/remove as entries are saved, instead of being rebuilt.
+    """
+
+    def __init__(self, db, normalized=None):
+        """
+        Args:
+            db (dict): The database to index.
+            normalized (dict): Precomputed key -> (title, author), e.g. from
+                load_normalized_title_author(). Entries missing from it are normalized here.
+        """
+        self._keys = {}   # (title, author) -> {key: None}, an insertion-ordered set of keys
+        self._pairs = {}  # key -> (title, author)
+        normalized = normalized or {}
+        for key, entry in db.items():
+            pair = normalized.get(key) or normalize_title_author(entry)
+            self._pairs[key] = pair
+            self._keys.setdefault(pair, {})[key] = None
+
+    def add(self, key, entry):
+        """
+        Index an entry, replacing any previous entry stored under the same key.
+        Args:
+            key (str): The entry key.
+            entry (dict): The entry fields.
+        """
+        self.remove(key)
+        pair = normalize_title_author(entry)
+        self._pairs[key] = pair
+        self._keys.setdefault(pair, {})[key] = None
+
+    def remove(self, key):
+        """
+        Remove an entry from the index if it is present.
+        Args:
+            key (str): The entry key.
+        """
+        pair = self._pairs.pop(key, None)
+        if pair is not None:
+            keys = self._keys[pair]
+            del keys[key]
+            if not keys:
+                del self._keys[pair]
+
+    def find(self, entry, exclude=None):
+        """
+        Find an indexed entry with the same title and author.
+        Args:
+            entry (dict): The entry fields to look up.
+            exclude (str): Key to ignore, e.g. the key the entry is being saved under.
+        Returns:
+            str: Key of the first matching entry, or None if there is none or
+            the entry has no title or author.
+        """
+        pair = normalize_title_author(entry)
+        if not all(pair):
+            return None
+        for key in self._keys.get(pair, ()):
+            if key != exclude:
+                return key
+        return None
+
 def import_entries():
     """
     Import BibTeX entries from input.txt, review each entry, and add to the database.
@@ -292,50 +595,7 @@ def import_entries():
         messagebox.showerror("Error", "input.txt file not found.")
         return
     with open(INPUT_FILE, 'r') as f:
-        lines = [line.rstrip() for line in f]
-
-    parsed_entries = []
-    entry = {}
-    key = None
-    entry_type = None
-    inside_entry = False
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith('@'):
-            inside_entry = True
-            if entry and key:
-                entry['entry_type'] = entry_type
-                parsed_entries.append((key, entry.copy()))
-            entry = {}
-            try:
-                entry_type, rest = line[1:].split('{', 1)
-                key = rest.split(',', 1)[0].strip()
-            except Exception:
-                entry_type = "article"
-                key = None
-        elif inside_entry and '=' in line:
-            try:
-                field, value = line.split('=', 1)
-                field = field.strip().lower()
-                value = value.strip().strip(',').strip('{}').strip()
-                entry[field] = value
-            except Exception:
-                continue
-        elif inside_entry and line.startswith('}'):
-            if entry and key:
-                entry['entry_type'] = entry_type
-                parsed_entries.append((key, entry.copy()))
-            entry = {}
-            key = None
-            entry_type = None
-            inside_entry = False
-
-    if entry and key:
-        entry['entry_type'] = entry_type
-        parsed_entries.append((key, entry.copy()))
+        parsed_entries = parse_bibtex(f.read())
 
     if not parsed_entries:
         messagebox.showinfo("Import", "No entries found in input.txt.")
@@ -346,9 +606,37 @@ def import_entries():
     db = load_db()
     idx = [0]
 
+    dup_index = DuplicateIndex(db, load_normalized_title_author())
+
+    def next_entry():
+        """
+        Move on to the next imported entry once the current form has closed.
+        Scheduling through the event loop keeps the call stack flat for large imports.
+        """
+        idx[0] += 1
+        root.after(0, show_entry_form)
+
+    def on_save(new_key, new_entry):
+        # Duplicate key check
+        if new_key in db:
+            res = messagebox.askyesno("Duplicate Key", f"An entry with key '{new_key}' already exists. Do you want to modify this entry and save as new?")
+            if not res:
+                next_entry()
+                return
+        # Duplicate title/author check
+        existing = dup_index.find(new_entry, exclude=new_key)
+        if existing:
+            res = messagebox.askyesno("Duplicate Entry", f"An entry with the same title and author already exists (key: {existing}). Do you want to modify this entry and save as new?")
+            if not res:
+                next_entry()
+                return
+        db[new_key] = new_entry
+        dup_index.add(new_key, new_entry)
+        next_entry()
+
     def show_entry_form():
         """
-        Show the entry form for each imported entry, allowing review and editing.
+        Show the entry form for the current imported entry, allowing review and editing.
         """
         if idx[0] >= len(parsed_entries):
             save_db(db)
@@ -356,46 +644,50 @@ def import_entries():
             return
 
         key, entry = parsed_entries[idx[0]]
-
-        def on_save(new_key, new_entry):
-            # Duplicate key check
-            if new_key in db:
-                res = messagebox.askyesno("Duplicate Key", f"An entry with key '{new_key}' already exists. Do you want to modify this entry and save as new?")
-                if not res:
-                    idx[0] += 1
-                    show_entry_form()
-                    return
-            # Duplicate title/author check
-            new_title = new_entry.get('title', '').strip().lower()
-            new_author = new_entry.get('author', '').strip().lower()
-            for k, e in db.items():
-                if k == new_key:
-                    continue
-                if e.get('title', '').strip().lower() == new_title and e.get('author', '').strip().lower() == new_author and new_title and new_author:
-                    res = messagebox.askyesno("Duplicate Entry", f"An entry with the same title and author already exists (key: {k}). Do you want to modify this entry and save as new?")
-                    if not res:
-                        idx[0] += 1
-                        show_entry_form()
-                        return
-            db[new_key] = new_entry
-            idx[0] += 1
-            show_entry_form()
-
-        def on_cancel():
-            idx[0] += 1
-            show_entry_form()
-
         entry_form_gui(
             mode="add",
             key=key,
             entry_data=entry,
             on_save=on_save,
-            on_cancel=on_cancel,
+            on_cancel=next_entry,
             title=f"Review Imported Entry {idx[0]+1} of {len(parsed_entries)}"
         )
 
     show_entry_form()
 
+def fuzzy_match_keys(query, values, sensitivity):
+    """
+    Find the entries whose value is similar enough to the query.
+    Uses rapidfuzz when it is available, otherwise difflib's SequenceMatcher.
+    Matching is case-insensitive; the values are expected to be casefolded already.
+    Args:
+        query (str): The search query.
+        values (dict): Mapping of entry key to the casefolded field value to compare.
+        sensitivity (float): Minimum similarity ratio between 0 and 1.
+    Returns:
+        set: Keys of the matching entries.
+    """
+    query = query.casefold()
+    if process:
+        matches = process.extract(query, values, scorer=fuzz.ratio, score_cutoff=sensitivity * 100, limit=None)
+        return {key for _, _, key in matches}
+    # SequenceMatcher caches its analysis of the second sequence, so the query goes there
+    matcher = SequenceMatcher()
+    matcher.set_seq2(query)
+    matched = set()
+    for key, value in values.items():
+        # Identical strings always match, no need to run SequenceMatcher on them
+        if value == query:
+            matched.add(key)
+            continue
+        matcher.set_seq1(value)
+        # The quick ratios are cheap upper bounds of ratio(), so failing either rules the value out
+        if (matcher.real_quick_ratio() >= sensitivity and
+                matcher.quick_ratio() >= sensitivity and
+                matcher.ratio() >= sensitivity):
+            matched.add(key)
+    return matched
+
 def search_entries_gui():
     """
     Open the search window to search for entries by field and query.
@@ -472,16 +764,31 @@ def search_entries_gui():
         db = load_db()
         field = field_cb.get()
         query = query_ent.get()
+        query_lower = query.casefold()
         selected_matches = [k for k, v in match_vars.items() if v.get()]
         fuzzy_sensitivity = fuzzy_slider.get() / 100.0
 
+        previous = (settings.get('match_options'), settings.get('fuzzy_sensitivity'))
         settings['match_options'] = selected_matches
         settings['fuzzy_sensitivity'] = int(fuzzy_slider.get())
-        save_settings(settings)
+        if (settings['match_options'], settings['fuzzy_sensitivity']) != previous:
+            save_settings(settings)
 
         result_box.delete(1.0, tk.END)
         results.clear()
 
+        lower_values = load_lowercase_field(field)
+        fuzzy_keys = set()
+        if 'fuzzy' in selected_matches:
+            fuzzy_keys = fuzzy_match_keys(query, lower_values, fuzzy_sensitivity)
+
+        pattern = None
+        if 'regex' in selected_matches:
+            try:
+                pattern = re.compile(query)
+            except re.error:
+                pass
+
         for key, entry in db.items():
             value = entry.get(field, '')
             matched = False
@@ -493,23 +800,18 @@ def search_entries_gui():
                 elif 'contains' in selected_matches and query in value:
                     matched = True
             else:
-                if 'exact' in selected_matches and value.lower() == query.lower():
+                value_lower = lower_values.get(key, '')
+                if 'exact' in selected_matches and value_lower == query_lower:
                     matched = True
-                elif 'contains' in selected_matches and query.lower() in value.lower():
+                elif 'contains' in selected_matches and query_lower in value_lower:
                     matched = True
 
-            if 'regex' in selected_matches:
-                try:
-                    if re.search(query, value):
-                        matched = True
-                except re.error:
-                    pass
-
-            if 'fuzzy' in selected_matches:
-                similarity = SequenceMatcher(None, value.lower(), query.lower()).ratio()
-                if similarity >= fuzzy_sensitivity:
-                    matched = True
-                    preview_match = True
+            if pattern is not None and pattern.search(value):
+                matched = True
+
+            if key in fuzzy_keys:
+                matched = True
+                preview_match = True
 
             if matched:
                 results.append((key, entry, value if preview_match else ''))
@@ -518,20 +820,16 @@ def search_entries_gui():
             result_box.insert(tk.END, "No matching entries found.\n")
             return
 
+        field_order = settings['field_order']
+        chunks = []
         for i, (k, entry, preview) in enumerate(results):
             entry_type = entry.get('entry_type', 'article')
-            bibtex_lines = []
-            bibtex_lines.append(f"@{entry_type}{{{k},")
-            for f in settings['field_order']:
-                if f in entry:
-                    bibtex_lines.append(f"\t{f}\t\t = {{{entry[f]}}},")
-            bibtex_lines[-1] = bibtex_lines[-1].rstrip(',')
-            bibtex_lines.append("}")
-            bibtex_entry = "\n".join(bibtex_lines)
-            result_box.insert(tk.END, f"Result {i+1}:\n{bibtex_entry}\n")
+            bibtex_entry = ",\n".join([f"@{entry_type}{{{k}"] + [f"\t{f}\t\t = {{{entry[f]}}}" for f in field_order if f in entry])
+            chunks.append(f"Result {i+1}:\n{bibtex_entry}\n}}\n")
             if preview:
-                result_box.insert(tk.END, f"Preview Match: {preview}\n")
-            result_box.insert(tk.END, "\n")
+                chunks.append(f"Preview Match: {preview}\n")
+            chunks.append("\n")
+        result_box.insert(tk.END, "".join(chunks))
 
     def edit_prompt():
         """
@@ -579,19 +877,24 @@ def browse_entries_gui():
         else:
             tree.column(col, width=250, anchor="w")
 
-    for idx, (key, entry) in enumerate(db.items(), 1):
-        authors = entry.get("author", "")
-        title = entry.get("title", "")
-        year = entry.get("year", "")
-        source = (
-            entry.get("journal") or
-            entry.get("booktitle") or
-            entry.get("conference") or
-            entry.get("publisher") or
-            entry.get("organization") or
-            ""
-        )
-        tree.insert("", "end", iid=key, values=(idx, authors, title, year, source))
+    rows = [
+        (key, (idx, entry.get("author", ""), entry.get("title", ""), entry.get("year", ""),
+               next((entry[k] for k in _SOURCE_KEYS if entry.get(k)), "")))
+        for idx, (key, entry) in enumerate(db.items(), 1)
+    ]
+
+    def insert_rows(start=0, chunk_size=500):
+        """
+        Insert the rows in chunks so the window stays responsive for large databases.
+        """
+        if not tree.winfo_exists():
+            return
+        for key, values in rows[start:start + chunk_size]:
+            tree.insert("", "end", iid=key, values=values)
+        if start + chunk_size < len(rows):
+            browse_win.after_idle(insert_rows, start + chunk_size)
+
+    insert_rows()
 
     tree.pack(fill="both", expand=True)
 